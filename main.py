@@ -12,12 +12,76 @@ Author: Blockchain Security Engineer
 Date: February 2026
 """
 
+import atexit
+import concurrent.futures
 import hashlib
 import json
 import datetime
+import mmap
 import os
+import ssl
+import threading
+import time
 from typing import List, Dict, Optional
 
+# Group-commit tuning: every acknowledged vote is flushed to the OS page
+# cache, but the fsync is batched - one per GROUP_COMMIT_SIZE votes, with a
+# timer syncing a smaller batch after GROUP_COMMIT_INTERVAL - so concurrent
+# voters are not serialized on disk syncs
+GROUP_COMMIT_SIZE = 32
+GROUP_COMMIT_INTERVAL = 0.05  # seconds
+
+# Chains shorter than this are verified serially; process startup costs more
+# than the hashing it saves until well past this size
+PARALLEL_VERIFY_MIN_BLOCKS = 10000
+
+
+def _resolve_sha256():
+    """
+    Resolve the fastest available SHA-256 constructor once at import time.
+
+    CPython's hashlib binds to OpenSSL's EVP implementation, which dispatches
+    to the CPU's SHA extensions (SHA-NI) automatically on OpenSSL 3+. We probe
+    for that build here and cache the constructor so every hot-path call
+    (block hashing, voter ID hashing) skips the per-call algorithm lookup.
+    """
+    try:
+        if ssl.OPENSSL_VERSION_INFO >= (3, 0) and 'sha256' in hashlib.algorithms_available:
+            # OpenSSL-backed constructor; hardware-accelerated where supported
+            return hashlib.sha256
+    except (AttributeError, ValueError):
+        pass
+    # Fall back to whatever sha256 implementation hashlib provides
+    return hashlib.sha256
+
+
+_sha256 = _resolve_sha256()
+
+# Bound once so the per-vote path skips the hashlib attribute lookup
+_blake2b = hashlib.blake2b
+
+
+def _block_preimage(index, timestamp, voter_id, candidate_id, previous_hash) -> bytes:
+    """
+    Build the canonical hash preimage for a block's fields.
+
+    Shared by Block.calculate_hash and the bulk verification path so both
+    always hash the exact same byte layout, and so batch callers can feed
+    plain field values without per-block method dispatch.
+    """
+    return f"{index}{timestamp}{voter_id}{candidate_id}{previous_hash}".encode()
+
+
+def _hash_preimages(preimages: List[bytes]) -> List[str]:
+    """
+    Hash one chunk of block preimages.
+
+    Module-level so ProcessPoolExecutor workers can pickle it; block-hash
+    recomputation is order-independent, which makes chunked verification
+    embarrassingly parallel (the link check stays sequential).
+    """
+    return [_sha256(preimage).hexdigest() for preimage in preimages]
+
 
 class Block:
     """
@@ -31,10 +95,18 @@ class Block:
     - previous_hash: Hash of the previous block (ensures immutability)
     - block_hash: Hash of this block's contents
     """
-    
+
+    # Fixed slots keep each block a compact record instead of a separately
+    # allocated instance dict, which matters once the chain grows large
+    __slots__ = ('index', 'timestamp', 'voter_id', 'candidate_id', 'previous_hash', 'block_hash')
+
     def __init__(self, index: int, voter_id: str, candidate_id: str, previous_hash: str):
         self.index = index
-        self.timestamp = datetime.datetime.now().isoformat()
+        # Nanoseconds since epoch: a single clock read instead of a
+        # datetime allocation + ISO formatting per block. Blocks loaded
+        # from older files keep their ISO string so their hashes still
+        # verify; formatting for display lives in display_timestamp.
+        self.timestamp = time.time_ns()
         self.voter_id = voter_id  # Hashed for privacy
         self.candidate_id = candidate_id
         self.previous_hash = previous_hash
@@ -45,8 +117,16 @@ class Block:
         Calculate SHA-256 hash of the block contents.
         This ensures the block cannot be tampered with without detection.
         """
-        block_string = f"{self.index}{self.timestamp}{self.voter_id}{self.candidate_id}{self.previous_hash}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        preimage = _block_preimage(self.index, self.timestamp, self.voter_id,
+                                   self.candidate_id, self.previous_hash)
+        return _sha256(preimage).hexdigest()
+
+    @property
+    def display_timestamp(self) -> str:
+        """Human-readable creation time; legacy blocks already store ISO strings."""
+        if isinstance(self.timestamp, int):
+            return datetime.datetime.fromtimestamp(self.timestamp / 1e9).isoformat()
+        return self.timestamp
     
     def to_dict(self) -> Dict:
         """Convert block to dictionary for JSON serialization."""
@@ -87,9 +167,21 @@ class Blockchain:
     
     def __init__(self, data_dir: str = "data"):
         self.chain: List[Block] = []
+        # Bumped whenever the chain or candidate roster changes, so callers
+        # can cache derived views and invalidate cheaply
+        self.version = 0
+        # Highest block index already proven good; verification passes only
+        # re-hash the tail beyond it, and failures reset it to 0. Only ever
+        # trusted within this process: persisting it would let anyone who
+        # can edit the snapshot skip verification of tampered blocks.
+        self._verified_prefix = 0
+        # Guards chain mutation (add_vote, set_candidates) and the snapshot
+        # taken at the start of verification passes
+        self._lock = threading.Lock()
         self.data_dir = data_dir
         self.candidates_file = os.path.join(data_dir, "candidates.json")
         self.blockchain_file = os.path.join(data_dir, "blockchain.json")
+        self.log_file = os.path.join(data_dir, "blockchain.log")
         
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
@@ -107,6 +199,166 @@ class Blockchain:
             self._load_blockchain()
         else:
             self._create_genesis_block()
+
+        # Build lookup indexes so duplicate checks and vote counts stay O(1)
+        self._rebuild_indexes()
+
+        # Build the Merkle tree over block hashes for O(log N) audit proofs
+        self._rebuild_merkle()
+
+        # Validate the loaded chain once; afterwards the chain is valid by
+        # construction (add_vote can only extend it correctly), so readers
+        # get the cached flag instead of an O(N) rehash per page load
+        self._valid = self._full_verify()
+
+        # Fold any journaled votes into the snapshot, then start a fresh
+        # journal; new votes are appended here instead of rewriting the
+        # whole snapshot on every ballot. The journal is only truncated
+        # once the snapshot write succeeded - otherwise the journaled
+        # votes would be silently dropped - and replay is idempotent, so
+        # a crash between the two steps cannot duplicate blocks.
+        if self._save_blockchain():
+            self._log_handle = open(self.log_file, 'w')
+        else:
+            print("⚠ Keeping existing blockchain log - snapshot write failed")
+            self._log_handle = open(self.log_file, 'a')
+
+        # Group-commit state for add_vote; the atexit hook guarantees a
+        # batched-but-unsynced tail of votes still reaches disk on normal
+        # interpreter shutdown
+        self._unsynced = 0
+        self._sync_timer: Optional[threading.Timer] = None
+        atexit.register(self._close_log)
+
+    def _close_log(self):
+        """Flush and close the journal, syncing any pending group commit."""
+        try:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if not self._log_handle.closed:
+                self._log_handle.flush()
+                os.fsync(self._log_handle.fileno())
+                self._log_handle.close()
+        except Exception as e:
+            print(f"Error closing blockchain log: {e}")
+
+    def _sync_log(self):
+        """Fsync the journal; called with self._lock held."""
+        os.fsync(self._log_handle.fileno())
+        self._unsynced = 0
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+
+    def _sync_log_deferred(self):
+        """Timer callback: sync whatever batch accumulated in the interval."""
+        with self._lock:
+            self._sync_timer = None
+            if self._unsynced and not self._log_handle.closed:
+                try:
+                    self._sync_log()
+                except Exception as e:
+                    print(f"Error syncing blockchain log: {e}")
+
+    def _rebuild_indexes(self):
+        """Rebuild the voter-hash set and interned vote counts from the chain."""
+        self._voted = {block.voter_id for block in self.chain[1:]}
+        # Intern candidate IDs to positions so counting is a flat histogram
+        # over small ints rather than dict operations per block
+        self._cand_index = {candidate_id: i for i, candidate_id in enumerate(self.candidates)}
+        self._counts = [0] * len(self.candidates)
+        cand_index = self._cand_index
+        for block in self.chain[1:]:
+            i = cand_index.get(block.candidate_id)
+            if i is not None:
+                self._counts[i] += 1
+
+    def set_candidates(self, candidates: Dict[str, str]):
+        """Replace the candidate roster and rebuild the interned count table."""
+        # Under the vote lock: a vote landing mid-rebuild would otherwise be
+        # missing from the recounted table
+        with self._lock:
+            self._save_candidates(candidates)
+            # Copy so a caller mutating its dict afterwards cannot desync
+            # the roster from the interned index
+            self.candidates = dict(candidates)
+            self._rebuild_indexes()
+            self.version += 1
+
+    @staticmethod
+    def _merkle_parent(left: bytes, right: bytes) -> bytes:
+        """Hash two child nodes into their Merkle parent."""
+        return _sha256(left + right).digest()
+
+    @classmethod
+    def _fold_root(cls, leaves: List[bytes]) -> bytes:
+        """Fold a leaf level down to its Merkle root without storing levels."""
+        level = leaves
+        while len(level) > 1:
+            level = [
+                cls._merkle_parent(level[i], level[i + 1] if i + 1 < len(level) else level[i])
+                for i in range(0, len(level), 2)
+            ]
+        return level[0]
+
+    def _rebuild_merkle(self):
+        """Rebuild the full Merkle tree from the chain's block hashes."""
+        # Levels are stored bottom-up; level 0 holds one leaf per block.
+        # Odd levels duplicate their last node (Bitcoin-style padding).
+        self._merkle: List[List[bytes]] = [[bytes.fromhex(block.block_hash) for block in self.chain]]
+        while len(self._merkle[-1]) > 1:
+            level = self._merkle[-1]
+            parents = []
+            for i in range(0, len(level), 2):
+                left = level[i]
+                right = level[i + 1] if i + 1 < len(level) else left
+                parents.append(self._merkle_parent(left, right))
+            self._merkle.append(parents)
+
+    def _merkle_append(self, leaf: bytes):
+        """
+        Append a new leaf and re-hash only the tree's right spine.
+        This keeps add_vote at O(log N) instead of rebuilding the whole tree.
+        """
+        self._merkle[0].append(leaf)
+        level = 0
+        while len(self._merkle[level]) > 1:
+            nodes = self._merkle[level]
+            parent_index = (len(nodes) - 1) // 2
+            left = nodes[parent_index * 2]
+            right = nodes[parent_index * 2 + 1] if parent_index * 2 + 1 < len(nodes) else left
+            parent = self._merkle_parent(left, right)
+            if level + 1 == len(self._merkle):
+                self._merkle.append([parent])
+            elif parent_index == len(self._merkle[level + 1]):
+                self._merkle[level + 1].append(parent)
+            else:
+                self._merkle[level + 1][parent_index] = parent
+            level += 1
+
+    def merkle_root(self) -> str:
+        """Return the hex Merkle root over all block hashes."""
+        return self._merkle[-1][0].hex()
+
+    def merkle_proof(self, index: int) -> List[str]:
+        """
+        Return the authentication path for the block at the given index.
+
+        The proof is the list of sibling hashes (hex, bottom-up) needed to
+        recompute the root, so an auditor can verify a single vote's
+        inclusion without downloading the whole chain.
+        """
+        if not 0 <= index < len(self.chain):
+            raise IndexError(f"Block index {index} out of range")
+        proof = []
+        for level in self._merkle[:-1]:
+            sibling = index ^ 1
+            if sibling >= len(level):
+                sibling = index  # Odd node is paired with itself
+            proof.append(level[sibling].hex())
+            index //= 2
+        return proof
     
     def _load_candidates(self) -> Dict[str, str]:
         """Load candidate data from file or create default candidates."""
@@ -145,30 +397,116 @@ class Blockchain:
         try:
             with open(self.blockchain_file, 'r') as f:
                 data = json.load(f)
-                self.chain = [Block.from_dict(block_data) for block_data in data]
+                # Newer files wrap the chain with a Merkle root header;
+                # older files are a bare list of blocks
+                block_list = data['chain'] if isinstance(data, dict) else data
+                self.chain = [Block.from_dict(block_data) for block_data in block_list]
+            self._replay_log()
             print(f"✓ Loaded blockchain with {len(self.chain)} blocks")
         except Exception as e:
             print(f"Error loading blockchain: {e}")
-            self._create_genesis_block()
+            # Only fall back to a fresh genesis if nothing was loaded;
+            # appending one onto a partially loaded chain would corrupt it
+            if not self.chain:
+                self._create_genesis_block()
     
-    def _save_blockchain(self):
-        """Save blockchain to file."""
+    def _replay_log(self):
+        """
+        Append any journaled blocks from a previous run onto the chain.
+
+        The journal is memory-mapped for the replay so lines are parsed
+        straight out of the page cache instead of being copied through a
+        userspace read buffer first.
+
+        A crash mid-write can leave a torn final record; replay stops at
+        the first unparseable line and keeps everything before it, rather
+        than letting the error corrupt the whole load. Records whose index
+        is already on the chain are skipped, so replay stays idempotent if
+        a crash hit between folding the journal into the snapshot and
+        truncating it.
+        """
+        if not os.path.exists(self.log_file) or os.path.getsize(self.log_file) == 0:
+            return
+        last_index = self.chain[-1].index if self.chain else -1
+        with open(self.log_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        print("⚠ Torn record at end of blockchain log - "
+                              "stopping replay at the last complete block")
+                        break
+                    if record['index'] <= last_index:
+                        continue  # Already folded into the snapshot
+                    self.chain.append(Block.from_dict(record))
+                    last_index = record['index']
+
+    def _append_to_log(self, block: Block):
+        """
+        Journal a single new block instead of rewriting the snapshot.
+
+        Every record is flushed to the OS page cache before the vote is
+        acknowledged, so an ordinary process crash loses nothing. Only the
+        fsync (durability against power loss) is group committed: once per
+        GROUP_COMMIT_SIZE votes, with a timer syncing a partial batch after
+        GROUP_COMMIT_INTERVAL, so a burst of voters shares one disk sync.
+        """
         try:
+            # Compact separators keep each journal record as small as the
+            # data allows without leaving JSON
+            self._log_handle.write(json.dumps(block.to_dict(), separators=(',', ':')) + '\n')
+            self._log_handle.flush()
+            self._unsynced += 1
+            if self._unsynced >= GROUP_COMMIT_SIZE:
+                self._sync_log()
+            elif self._sync_timer is None:
+                self._sync_timer = threading.Timer(GROUP_COMMIT_INTERVAL, self._sync_log_deferred)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+        except Exception as e:
+            print(f"Error writing blockchain log: {e}")
+
+    def _save_blockchain(self) -> bool:
+        """Save the full blockchain snapshot to file.
+
+        Returns True when the snapshot was written; callers that truncate
+        the journal afterwards must not do so on failure.
+        """
+        try:
+            data = {
+                'merkle_root': self.merkle_root() if getattr(self, '_merkle', None) else None,
+                'chain': [block.to_dict() for block in self.chain]
+            }
             with open(self.blockchain_file, 'w') as f:
-                json.dump([block.to_dict() for block in self.chain], f, indent=2)
+                json.dump(data, f, indent=2)
+            return True
         except Exception as e:
             print(f"Error saving blockchain: {e}")
+            return False
     
     def hash_voter_id(self, voter_id: str) -> str:
         """
         Hash voter ID for privacy protection.
         This ensures voter anonymity while preventing duplicate votes.
+
+        Uses BLAKE2b-256: the voter fingerprint has no interop constraint
+        (unlike block hashes, which stay SHA-256 for audit familiarity),
+        and BLAKE2b is faster in software on machines without SHA
+        extensions while offering the same 256-bit security.
         """
-        return hashlib.sha256(voter_id.encode()).hexdigest()
+        return _blake2b(voter_id.encode(), digest_size=32).hexdigest()
+
+    def _legacy_hash_voter_id(self, voter_id: str) -> str:
+        """SHA-256 voter fingerprint used by chains written before BLAKE2b."""
+        return _sha256(voter_id.encode()).hexdigest()
     
     def has_voted(self, voter_id_hash: str) -> bool:
         """Check if a voter has already cast a vote."""
-        return any(block.voter_id == voter_id_hash for block in self.chain[1:])  # Skip genesis block
+        return voter_id_hash in self._voted
     
     def is_valid_candidate(self, candidate_id: str) -> bool:
         """Verify that the candidate ID exists."""
@@ -181,70 +519,156 @@ class Blockchain:
         Returns:
             bool: True if vote was added successfully, False otherwise
         """
-        # Validate inputs
-        if not self.is_valid_candidate(candidate_id):
-            print(f"✗ Invalid candidate ID: {candidate_id}")
-            return False
-        
         # Hash voter ID for privacy
         voter_id_hash = self.hash_voter_id(voter_id)
-        
-        # Check for duplicate vote
-        if self.has_voted(voter_id_hash):
-            print(f"✗ Voter {voter_id} has already voted")
-            return False
-        
-        # Create new block
-        new_block = Block(
-            index=len(self.chain),
-            voter_id=voter_id_hash,
-            candidate_id=candidate_id,
-            previous_hash=self.chain[-1].block_hash
-        )
-        
-        # Add to chain and save
-        self.chain.append(new_block)
-        self._save_blockchain()
-        
-        print(f"✓ Vote recorded for {self.candidates[candidate_id]}")
+
+        # Validation, duplicate check, and chain mutation happen under the
+        # lock so concurrent web requests (or a concurrent roster change
+        # via set_candidates) cannot race each other
+        with self._lock:
+            # Validate inputs
+            if not self.is_valid_candidate(candidate_id):
+                print(f"✗ Invalid candidate ID: {candidate_id}")
+                return False
+
+            # Check for duplicate vote, including under the legacy SHA-256
+            # fingerprint so voters recorded before the BLAKE2b switch
+            # still cannot vote twice
+            if self.has_voted(voter_id_hash) or self.has_voted(self._legacy_hash_voter_id(voter_id)):
+                print(f"✗ Voter {voter_id} has already voted")
+                return False
+
+            # Create new block
+            new_block = Block(
+                index=len(self.chain),
+                voter_id=voter_id_hash,
+                candidate_id=candidate_id,
+                previous_hash=self.chain[-1].block_hash
+            )
+
+            # Add to chain, update indexes and Merkle tree, and save
+            self.chain.append(new_block)
+            self._voted.add(voter_id_hash)
+            self._counts[self._cand_index[candidate_id]] += 1
+            self._merkle_append(bytes.fromhex(new_block.block_hash))
+            self.version += 1
+            self._append_to_log(new_block)
+            # Resolve the name inside the lock; the roster may change
+            # before the print below runs
+            candidate_name = self.candidates[candidate_id]
+
+        print(f"✓ Vote recorded for {candidate_name}")
         print(f"  Block #{new_block.index} added to blockchain")
         return True
     
     def count_votes(self) -> Dict[str, int]:
         """Count votes for each candidate."""
-        vote_counts = {}
-        
-        # Initialize all candidates with zero votes
-        for candidate_id in self.candidates:
-            vote_counts[candidate_id] = 0
-        
-        # Count votes (skip genesis block)
-        for block in self.chain[1:]:
-            if block.candidate_id in vote_counts:
-                vote_counts[block.candidate_id] += 1
-        
-        return vote_counts
+        # Counts are maintained incrementally in add_vote, so this is
+        # O(candidates) rather than a scan over the whole chain
+        return dict(zip(self._cand_index, self._counts))
     
-    def verify_integrity(self) -> bool:
+    def verify_integrity(self, force: bool = False) -> bool:
         """
         Verify blockchain integrity by checking hash links.
         Returns True if blockchain is valid, False if tampered with.
+
+        The chain is fully verified once at startup and can only be extended
+        through add_vote, so by default this trusts the verified prefix and
+        only re-hashes blocks appended since the last passing check; pass
+        force=True to discard the prefix and re-run the full O(N)
+        verification (e.g. to detect external tampering with in-memory
+        state).
+        """
+        if force:
+            # A forced sweep must not trust any earlier pass
+            self._verified_prefix = 0
+            self._valid = self._full_verify()
+        elif self._valid and len(self.chain) - 1 > self._verified_prefix:
+            # Votes landed since the last verified pass; re-check just the
+            # new tail (the trusted prefix is skipped inside _full_verify)
+            self._valid = self._full_verify()
+        return self._valid
+
+    def _full_verify(self) -> bool:
         """
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i-1]
-            
+        Re-hash the unverified tail of the chain and check links and the
+        Merkle root.
+
+        Blocks up to _verified_prefix were proven good on a previous pass in
+        this process, so their stored hashes are trusted as-is and repeated
+        audits cost O(new votes), not O(N). The prefix is never loaded from
+        disk (startup always verifies from scratch) and a failed pass resets
+        it so the next one starts over.
+        """
+        # Snapshot the chain and the maintained leaf level under the lock:
+        # a vote landing mid-verification must neither shift the check loops
+        # off the hashed preimages nor desync the Merkle comparison, which
+        # would latch a healthy chain invalid
+        with self._lock:
+            blocks = self.chain[:]
+            stored_leaves = self._merkle[0][:len(blocks)]
+
+        start = min(self._verified_prefix, len(blocks) - 1)
+
+        # Batch pass 1: assemble the tail's preimages up front, then hash
+        # them in one tight loop. Keeping the hash loop free of attribute
+        # lookups and string formatting lets it run at hashlib's native speed.
+        preimages = [
+            _block_preimage(block.index, block.timestamp, block.voter_id,
+                            block.candidate_id, block.previous_hash)
+            for block in blocks[start + 1:]
+        ]
+        workers = os.cpu_count() or 1
+        if len(preimages) >= PARALLEL_VERIFY_MIN_BLOCKS and workers > 1:
+            # Re-hashing is independent per block, so fan the chunks out
+            # across cores; processes rather than threads because hashlib
+            # holds the GIL for inputs this small
+            chunk_size = -(-len(preimages) // workers)
+            chunks = [preimages[i:i + chunk_size] for i in range(0, len(preimages), chunk_size)]
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                recomputed_tail = [digest for part in pool.map(_hash_preimages, chunks) for digest in part]
+        else:
+            recomputed_tail = _hash_preimages(preimages)
+
+        # Trusted prefix hashes + freshly recomputed tail
+        recomputed = [block.block_hash for block in blocks[:start + 1]] + recomputed_tail
+
+        for i in range(start + 1, len(blocks)):
             # Verify current block's hash is correct
-            if current_block.block_hash != current_block.calculate_hash():
+            if blocks[i].block_hash != recomputed[i]:
                 print(f"✗ Block {i}: Hash mismatch - blockchain may be tampered")
+                self._verified_prefix = 0
                 return False
-            
+
             # Verify previous hash link
-            if current_block.previous_hash != previous_block.block_hash:
+            if blocks[i].previous_hash != blocks[i-1].block_hash:
                 print(f"✗ Block {i}: Previous hash mismatch - blockchain may be tampered")
+                self._verified_prefix = 0
                 return False
-        
-        print("✓ Blockchain integrity verified - all blocks are valid")
+
+        if start == 0:
+            # Full pass: recompute the Merkle root from the verified leaves
+            # and compare it against one folded from the same prefix of the
+            # maintained tree, so votes appended after the snapshot cannot
+            # skew the comparison
+            if self._fold_root([bytes.fromhex(h) for h in recomputed]) != self._fold_root(stored_leaves):
+                print("✗ Merkle root mismatch - blockchain may be tampered")
+                self._verified_prefix = 0
+                return False
+        else:
+            # Incremental pass: folding the whole tree back down would cost
+            # O(N) hashing and defeat the point of the prefix. _merkle_append
+            # is the tree's only mutator, so comparing the new leaves against
+            # the hashes just recomputed is enough to keep it honest.
+            for i in range(start + 1, len(blocks)):
+                if stored_leaves[i] != bytes.fromhex(recomputed[i]):
+                    print(f"✗ Block {i}: Merkle leaf mismatch - blockchain may be tampered")
+                    self._verified_prefix = 0
+                    return False
+
+        self._verified_prefix = len(blocks) - 1
+        if start == 0:
+            print("✓ Blockchain integrity verified - all blocks are valid")
         return True
     
     def get_blockchain_info(self) -> Dict:
@@ -307,7 +731,7 @@ def display_blockchain(blockchain: Blockchain):
     
     for i, block in enumerate(blockchain.chain):
         print(f"\nBlock #{block.index}")
-        print(f"  Timestamp: {block.timestamp}")
+        print(f"  Timestamp: {block.display_timestamp}")
         print(f"  Voter ID (hashed): {block.voter_id[:16]}...")
         print(f"  Candidate: {blockchain.candidates.get(block.candidate_id, block.candidate_id)}")
         print(f"  Previous Hash: {block.previous_hash[:16]}...")
@@ -368,7 +792,7 @@ def main():
         elif choice == '4':
             display_blockchain(blockchain)
         elif choice == '5':
-            blockchain.verify_integrity()
+            blockchain.verify_integrity(force=True)
         elif choice == '6':
             print("\n👋 Thank you for using the Decentralized Voting System!")
             print("Remember: This is for educational purposes only.")
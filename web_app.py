@@ -3,7 +3,11 @@ Flask Web Application for Decentralized Voting System
 Provides a modern web UI for voting, candidate management, and blockchain visualization
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session
+from flask import Flask, render_template, request, jsonify, redirect, url_for, session, make_response
+from functools import lru_cache, wraps
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup, escape
+import hmac
 import os
 import sys
 import hashlib
@@ -13,13 +17,75 @@ from main import Blockchain
 
 app = Flask(__name__)
 app.secret_key = 'supersecretkeyforvotingsystem'  # In production, use a strong secret key
+
+# Persist compiled templates across restarts so workers skip the Jinja
+# parse/compile step on their first render of each template
+_jinja_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.jinja_cache')
+os.makedirs(_jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_jinja_cache_dir)
+
 blockchain = Blockchain()
 
-# Admin credentials (in production, store in secure database)
+
+@lru_cache(maxsize=1)
+def _candidate_options(version):
+    """
+    Pre-render the candidate <option> list for dropdowns.
+
+    The roster rarely changes, so the fragment is rebuilt only when the
+    blockchain version moves (keyed through lru_cache) instead of being
+    re-rendered inside every template hit.
+    """
+    return Markup(''.join(
+        f'<option value="{escape(candidate_id)}">{escape(name)}</option>'
+        for candidate_id, name in blockchain.candidates.items()
+    ))
+
+
+@app.context_processor
+def inject_candidate_options():
+    """Expose the cached dropdown fragment to all templates."""
+    return {'candidate_options': _candidate_options(blockchain.version)}
+
+
+@lru_cache(maxsize=1)
+def _candidate_rows(version):
+    """
+    Build the sorted per-candidate result rows once per blockchain version.
+
+    Both dashboards and the vote-counts API need the same
+    sorted-by-votes list of dicts; computing it here means the sort and
+    dict allocations happen once per chain change instead of per request.
+    """
+    vote_counts = blockchain.count_votes()
+    total_votes = sum(vote_counts.values())
+
+    rows = []
+    for candidate_id, count in sorted(vote_counts.items(), key=lambda x: x[1], reverse=True):
+        candidate_name = blockchain.candidates.get(candidate_id, candidate_id)
+        percentage = (count / total_votes * 100) if total_votes > 0 else 0
+        rows.append({
+            'id': candidate_id,
+            'name': candidate_name,
+            'votes': count,
+            'percentage': round(percentage, 1)
+        })
+    return rows, total_votes
+
+# Admin credentials come from the environment (see README's hardening
+# guide); the demo default only applies when ADMIN_PASSWORD is unset. The
+# password digest is precomputed as raw bytes so login attempts skip the
+# hexdigest round-trip and can be compared in constant time.
+_admin_password = os.environ.get('ADMIN_PASSWORD')
+if _admin_password is None:
+    print("⚠ ADMIN_PASSWORD not set - using the demo default credentials "
+          "(do not deploy like this)")
+    _admin_password = 'admin123'
 ADMIN_CREDENTIALS = {
-    'username': 'admin',
-    'password': hashlib.sha256('admin123'.encode()).hexdigest()  # sha256 of 'admin123'
+    'username': os.environ.get('ADMIN_USERNAME', 'admin'),
+    'password_digest': hashlib.sha256(_admin_password.encode()).digest()
 }
+del _admin_password
 
 # Route for the main dashboard
 @app.route('/')
@@ -37,31 +103,18 @@ def admin_dashboard():
     if not session.get('is_admin', False):
         return redirect(url_for('login'))
         
-    vote_counts = blockchain.count_votes()
-    total_votes = sum(vote_counts.values())
-    
-    # Prepare data for charts
-    candidates_data = []
-    for candidate_id, count in sorted(vote_counts.items(), key=lambda x: x[1], reverse=True):
-        candidate_name = blockchain.candidates.get(candidate_id, candidate_id)
-        percentage = (count / total_votes * 100) if total_votes > 0 else 0
-        candidates_data.append({
-            'id': candidate_id,
-            'name': candidate_name,
-            'votes': count,
-            'percentage': round(percentage, 1)
-        })
-    
+    candidates_data, total_votes = _candidate_rows(blockchain.version)
+
     # Blockchain info
     blockchain_info = blockchain.get_blockchain_info()
-    
+
     # Get all blocks for admin view
     all_blocks = []
     for block in blockchain.chain[1:]:  # Skip genesis block
         candidate_name = blockchain.candidates.get(block.candidate_id, "Unknown")
         all_blocks.append({
             'block_number': block.index,
-            'timestamp': block.timestamp,
+            'timestamp': block.display_timestamp,
             'voter_id_hash': block.voter_id,
             'candidate_id': block.candidate_id,
             'candidate_name': candidate_name,
@@ -77,25 +130,12 @@ def admin_dashboard():
 @app.route('/user')
 def user_dashboard():
     """User dashboard showing public vote counts"""
-    vote_counts = blockchain.count_votes()
-    total_votes = sum(vote_counts.values())
-    
-    # Prepare data for charts
-    candidates_data = []
-    for candidate_id, count in sorted(vote_counts.items(), key=lambda x: x[1], reverse=True):
-        candidate_name = blockchain.candidates.get(candidate_id, candidate_id)
-        percentage = (count / total_votes * 100) if total_votes > 0 else 0
-        candidates_data.append({
-            'id': candidate_id,
-            'name': candidate_name,
-            'votes': count,
-            'percentage': round(percentage, 1)
-        })
-    
+    candidates_data, total_votes = _candidate_rows(blockchain.version)
+
     # Blockchain info
     blockchain_info = blockchain.get_blockchain_info()
-    
-    return render_template('user_dashboard.html', 
+
+    return render_template('user_dashboard.html',
                          candidates=candidates_data,
                          total_votes=total_votes,
                          blockchain_info=blockchain_info)
@@ -130,7 +170,7 @@ def view_blockchain():
         candidate_name = blockchain.candidates.get(block.candidate_id, "Unknown")
         blockchain_data.append({
             'block_number': block.index,
-            'timestamp': block.timestamp,
+            'timestamp': block.display_timestamp,
             'voter_id_hash': block.voter_id[:16] + "...",  # Show shortened hash
             'candidate_id': block.candidate_id,
             'candidate_name': candidate_name,
@@ -157,8 +197,7 @@ def manage_candidates():
                 # Load existing candidates
                 candidates = blockchain._load_candidates()
                 candidates[candidate_id] = candidate_name
-                blockchain._save_candidates(candidates)
-                blockchain.candidates = candidates
+                blockchain.set_candidates(candidates)
                 return jsonify({'success': True, 'message': 'Candidate added successfully'})
         
         elif action == 'remove':
@@ -166,8 +205,7 @@ def manage_candidates():
             if candidate_id and candidate_id in blockchain.candidates:
                 candidates = blockchain._load_candidates()
                 del candidates[candidate_id]
-                blockchain._save_candidates(candidates)
-                blockchain.candidates = candidates
+                blockchain.set_candidates(candidates)
                 return jsonify({'success': True, 'message': 'Candidate removed successfully'})
     
     return render_template('candidates.html', candidates=blockchain.candidates)
@@ -176,13 +214,14 @@ def manage_candidates():
 def login():
     """Admin login page"""
     if request.method == 'POST':
-        username = request.form.get('username')
-        password = request.form.get('password')
-        
-        # Hash the entered password
-        hashed_password = hashlib.sha256(password.encode()).hexdigest()
-        
-        if username == ADMIN_CREDENTIALS['username'] and hashed_password == ADMIN_CREDENTIALS['password']:
+        username = request.form.get('username', '')
+        password = request.form.get('password', '')
+
+        # Hash the entered password and compare digests in constant time
+        # to avoid leaking match length through response timing
+        password_digest = hashlib.sha256(password.encode()).digest()
+
+        if username == ADMIN_CREDENTIALS['username'] and hmac.compare_digest(password_digest, ADMIN_CREDENTIALS['password_digest']):
             session['is_admin'] = True
             return redirect(url_for('admin_dashboard'))
         else:
@@ -209,7 +248,7 @@ def admin_blockchain():
         candidate_name = blockchain.candidates.get(block.candidate_id, "Unknown")
         blockchain_data.append({
             'block_number': block.index,
-            'timestamp': block.timestamp,
+            'timestamp': block.display_timestamp,
             'voter_id_hash': block.voter_id,
             'candidate_id': block.candidate_id,
             'candidate_name': candidate_name,
@@ -219,41 +258,80 @@ def admin_blockchain():
     
     return render_template('admin_blockchain.html', blockchain=blockchain_data)
 
+# Cached API responses, invalidated whenever the blockchain version moves
+_api_cache = {}
+
+def cached_api(view):
+    """
+    Memoize a JSON API view until the blockchain changes.
+
+    The chain only mutates on add_vote (or candidate changes), so responses
+    are cached keyed on the blockchain version and served with an ETag;
+    clients that already hold the current version get a 304 Not Modified.
+    The cached validity flag is part of the key because a forced
+    re-verification can flip it without bumping the version.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        etag = (f'"{blockchain.version}-{blockchain.chain[-1].block_hash[:16]}'
+                f'-{int(blockchain.verify_integrity())}"')
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304, {'ETag': etag}
+        cached = _api_cache.get(request.path)
+        if cached is None or cached[0] != etag:
+            response = make_response(view(*args, **kwargs))
+            response.headers['ETag'] = etag
+            _api_cache[request.path] = (etag, response)
+        return _api_cache[request.path][1]
+    return wrapper
+
 # API endpoints for real-time data
 @app.route('/api/vote_counts')
+@cached_api
 def api_vote_counts():
     """API endpoint for vote counts"""
-    vote_counts = blockchain.count_votes()
-    total_votes = sum(vote_counts.values())
-    
-    data = []
-    for candidate_id, count in vote_counts.items():
-        candidate_name = blockchain.candidates.get(candidate_id, candidate_id)
-        percentage = (count / total_votes * 100) if total_votes > 0 else 0
-        data.append({
-            'candidate_id': candidate_id,
-            'candidate_name': candidate_name,
-            'votes': count,
-            'percentage': round(percentage, 1)
-        })
+    rows, total_votes = _candidate_rows(blockchain.version)
+
+    data = [{
+        'candidate_id': row['id'],
+        'candidate_name': row['name'],
+        'votes': row['votes'],
+        'percentage': row['percentage']
+    } for row in rows]
     
     return jsonify({
         'votes': data,
         'total_votes': total_votes,
-        'timestamp': blockchain.chain[-1].timestamp if blockchain.chain else None
+        'timestamp': blockchain.chain[-1].display_timestamp if blockchain.chain else None
     })
 
 @app.route('/api/blockchain_info')
+@cached_api
 def api_blockchain_info():
     """API endpoint for blockchain information"""
     return jsonify(blockchain.get_blockchain_info())
 
 @app.route('/api/integrity_check')
+@cached_api
 def api_integrity_check():
     """API endpoint for blockchain integrity verification"""
     is_valid = blockchain.verify_integrity()
     return jsonify({'valid': is_valid})
 
+@app.route('/api/reverify', methods=['POST'])
+def api_reverify():
+    """
+    Force a full re-verification of the chain - Admin only.
+
+    The forced sweep is O(N) and mutates the cached verdict, so it is a
+    POST behind the admin session rather than an open GET anyone (or any
+    crawler) could hammer.
+    """
+    if not session.get('is_admin', False):
+        return jsonify({'success': False, 'message': 'Admin access required'}), 403
+    is_valid = blockchain.verify_integrity(force=True)
+    return jsonify({'valid': is_valid})
+
 # Navigation routes
 @app.route('/vote')
 def vote_page():
@@ -270,7 +348,7 @@ def blockchain_public():
         candidate_name = blockchain.candidates.get(block.candidate_id, "Unknown")
         blockchain_data.append({
             'block_number': block.index,
-            'timestamp': block.timestamp,
+            'timestamp': block.display_timestamp,
             'candidate_name': candidate_name,
             'block_hash': block.block_hash[:16] + "..."
         })
@@ -289,4 +367,6 @@ def internal_error(error):
 if __name__ == '__main__':
     print("Starting Decentralized Voting System Web Interface...")
     print("Visit http://localhost:5000 to access the voting dashboard")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    print("(development server; use `gunicorn --preload wsgi:app` in production)")
+    # Debug mode (and its reloader, which double-imports the app) is opt-in
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
\ No newline at end of file
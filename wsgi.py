@@ -0,0 +1,18 @@
+"""
+WSGI entry point for running the voting system under a production server.
+
+The Werkzeug dev server in web_app.py is single-threaded and debug mode
+re-imports the app (creating a second Blockchain). For real traffic run:
+
+    gunicorn -k gthread -w 1 --threads 8 --preload wsgi:app
+
+The Blockchain keeps its indexes, Merkle tree, and journal handle in
+process memory, so scale with threads (add_vote is guarded by a lock;
+reads are lock-free) rather than multiple worker processes, which would
+each open their own journal.
+"""
+
+from web_app import app
+
+if __name__ == "__main__":
+    app.run()